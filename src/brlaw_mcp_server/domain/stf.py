@@ -1,15 +1,42 @@
+import asyncio
+import contextlib
 import logging
 import urllib.parse
-from typing import TYPE_CHECKING, Self, cast, override
+from typing import TYPE_CHECKING, Final, Self, cast, override
+from weakref import WeakKeyDictionary
+
+from patchright.async_api import TimeoutError
 
 from brlaw_mcp_server.domain.base import BaseLegalPrecedent
 
 if TYPE_CHECKING:
-    from patchright.async_api import Page
+    from patchright.async_api import Browser, BrowserContext, Page
 
 
 _LOGGER = logging.getLogger(__name__)
 
+_RENDER_TIMEOUT_MS = 1000 * 30
+"""Timeout for the search page to render the results counter and the results themselves."""
+
+_RESULT_ACTION_TIMEOUT_MS = 1000 * 5
+"""Timeout for actions on results that are already rendered, to fail fast when one is broken
+instead of blocking for Playwright's default 30 seconds."""
+
+_clipboard_locks: Final["WeakKeyDictionary[Browser | BrowserContext, asyncio.Lock]"] = (
+    WeakKeyDictionary()
+)
+"""Locks guarding the clipboard of each browser.
+
+The clipboard belongs to the whole browser process rather than to a context, and the browser may
+be shared by concurrent researches. Without the lock, a research could read a summary copied by
+another one."""
+
+
+def _get_clipboard_lock(page: "Page") -> asyncio.Lock:
+    # Contexts not created through a browser, such as persistent ones, have their own process.
+    owner = page.context.browser or page.context
+    return _clipboard_locks.setdefault(owner, asyncio.Lock())
+
 
 class StfLegalPrecedent(BaseLegalPrecedent):
     """A legal precedent from the Supreme Federal Court of Brazil (STF)."""
@@ -36,10 +63,9 @@ class StfLegalPrecedent(BaseLegalPrecedent):
             )
         )
 
-        response = await browser.goto(
-            url,
-            wait_until="networkidle",  # Page keeps loading async.
-        )
+        # The page keeps loading async. Rather than waiting for the whole network to settle,
+        # which adds seconds to every search, the elements needed are awaited further below.
+        response = await browser.goto(url, wait_until="domcontentloaded")
 
         if response is None or response.status >= 300:  # noqa: PLR2004  # constant used only once.
             _LOGGER.error(
@@ -56,17 +82,23 @@ class StfLegalPrecedent(BaseLegalPrecedent):
 
             raise RuntimeError("The server's response wasn't as expected")
 
-        numbers_of_results_locators = await browser.locator(
+        locator_numbers_of_precedents = browser.locator(
             "div.mat-tooltip-trigger > span.ml-5.font-weight-500"
-        ).all()
+        )
+        with contextlib.suppress(TimeoutError):  # Handled by the check below.
+            await locator_numbers_of_precedents.first.wait_for(
+                timeout=_RENDER_TIMEOUT_MS
+            )
 
-        if len(numbers_of_results_locators) == 0:
-            raise RuntimeError("Failed to get the number of results")
+        txts_numbers_of_precedents = (
+            await locator_numbers_of_precedents.all_text_contents()
+        )
 
-        txt_numbers_of_precedents = await numbers_of_results_locators[0].text_content()
-        if txt_numbers_of_precedents is None:
+        if len(txts_numbers_of_precedents) == 0:
             raise RuntimeError("Failed to get the number of results")
 
+        txt_numbers_of_precedents = txts_numbers_of_precedents[0]
+
         numbers_of_precedents = int(
             txt_numbers_of_precedents.strip("() ").replace(".", "")
         )
@@ -74,20 +106,29 @@ class StfLegalPrecedent(BaseLegalPrecedent):
         if numbers_of_precedents == 0:
             return []
 
-        results_locators = await browser.locator("div[id^=result-index-]").all()
+        locator_results = browser.locator("div[id^=result-index-]")
+        with contextlib.suppress(TimeoutError):  # Handled by the check below.
+            await locator_results.first.wait_for(timeout=_RENDER_TIMEOUT_MS)
+
+        results_locators = await locator_results.all()
         if len(results_locators) == 0:
             raise RuntimeError("Failed to find the results when there are results")
 
         # Needed ahead to read the copied summaries.
         await browser.context.grant_permissions(["clipboard-read"])
 
+        clipboard_lock = _get_clipboard_lock(browser)
+
         return_value: list[Self] = []
         for result_locator in results_locators:
-            await result_locator.locator("app-clipboard").click()
-            handle = await browser.evaluate_handle(
-                "() => navigator.clipboard.readText()"
-            )
-            summary = cast("str", await handle.json_value())
+            async with clipboard_lock:
+                await result_locator.locator("app-clipboard").click(
+                    timeout=_RESULT_ACTION_TIMEOUT_MS
+                )
+                summary = cast(
+                    "str",
+                    await browser.evaluate("() => navigator.clipboard.readText()"),
+                )
 
             return_value.append(
                 cls(
@@ -6,9 +6,11 @@ HTML with ISO-8859-1 encoding containing textarea elements with
 the ementa text.
 """
 
+import asyncio
 import logging
 import re
 import unicodedata
+from http.cookiejar import CookieJar, DefaultCookiePolicy
 from typing import TYPE_CHECKING, Self, override
 from urllib.parse import quote
 
@@ -17,6 +19,8 @@ import httpx
 from brlaw_mcp_server.domain.base import BaseLegalPrecedent
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from patchright.async_api import Page
 
 _LOGGER = logging.getLogger(__name__)
@@ -24,6 +28,8 @@ _LOGGER = logging.getLogger(__name__)
 _SEARCH_URL = "https://processo.stj.jus.br/SCON/pesquisar.jsp"
 _RESULTS_PER_PAGE = 10
 _MAX_RETRIES = 2
+_MAX_CONCURRENT_PAGES = 4
+_RETRY_DELAY = 0.5
 _HTTP_TIMEOUT = 30.0
 _ENCODING = "iso-8859-1"
 
@@ -40,12 +46,73 @@ _HEADERS = {
     "Referer": "https://processo.stj.jus.br/SCON/",
 }
 
+# Form fields that are the same for every search. They are plain ASCII, so
+# they are percent-encoded once here instead of on every request.
+_STATIC_FORM_FIELDS = (
+    ("b", "ACOR"),
+    ("O", "RR"),
+    ("acao", "pesquisar"),
+    ("tipoPesquisa", "tipoPesquisaGenerica"),
+    ("thesaurus", "JURIDICO"),
+    ("p", "true"),
+    ("tp", "T"),
+)
+_STATIC_FORM_BODY = "&".join(
+    f"{key}={quote(value, safe='', encoding=_ENCODING)}"
+    for key, value in _STATIC_FORM_FIELDS
+)
+
 # Regex to extract ementa text from textarea elements
 _EMENTA_PATTERN = re.compile(
     r'<textarea[^>]*id="textSemformatacao\d+"[^>]*>(.*?)</textarea>',
     re.DOTALL,
 )
 
+# Regex to extract the message SCON renders when the search itself fails
+_ERROR_MESSAGE_PATTERN = re.compile(
+    r'<div class="erroMensagem">(.*?)</div>',
+    re.DOTALL,
+)
+
+
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+"""The event loop ``_client`` was created in, which its connections are bound to."""
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Get the HTTP client shared by every STJ research of the running event loop.
+
+    Sharing it keeps connections to SCON alive between searches, sparing each one a new
+    TCP + TLS handshake. Cookies are refused, though: a session shared among concurrent and
+    unrelated searches could mix up their server-side state, so each search stays
+    self-contained.
+
+    A client left by another event loop can neither be used nor closed, so it is replaced."""
+    global _client, _client_loop  # noqa: PLW0603  # rebuilt whenever the running loop changes.
+
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client_loop = loop
+        _client = httpx.AsyncClient(
+            timeout=_HTTP_TIMEOUT,
+            verify=False,  # noqa: S501 — STJ cert chain sometimes incomplete
+            follow_redirects=True,
+            cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=())),
+        )
+
+    return _client
+
+
+async def close_shared_client() -> None:
+    """Close the HTTP client shared by STJ researches, if any. Meant to be called on shutdown."""
+    global _client  # noqa: PLW0603  # see `_get_client`.
+
+    if _client is not None and _client_loop is asyncio.get_running_loop():
+        await _client.aclose()
+
+    _client = None
+
 
 class StjLegalPrecedent(BaseLegalPrecedent):
     """Model for a legal precedent from the Superior Tribunal de Justica (STJ)."""
@@ -72,43 +139,33 @@ class StjLegalPrecedent(BaseLegalPrecedent):
         # (a + combining tilde) which cannot be encoded in ISO-8859-1.
         summary_search_prompt = unicodedata.normalize("NFC", summary_search_prompt)
 
-        _LOGGER.debug(
-            "Building form body — query: %s (len=%d, bytes=%s)",
-            repr(summary_search_prompt),
-            len(summary_search_prompt),
-            summary_search_prompt.encode("utf-8").hex(),
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Building form body — query: %r (len=%d, bytes=%s)",
+                summary_search_prompt,
+                len(summary_search_prompt),
+                summary_search_prompt.encode("utf-8").hex(),
+            )
+
+        try:
+            encoded_prompt = quote(summary_search_prompt, safe="", encoding=_ENCODING)
+        except UnicodeEncodeError:
+            # Fallback: strip diacritics for chars outside ISO-8859-1
+            _LOGGER.warning(
+                "ISO-8859-1 encoding failed for the search prompt, stripping diacritics"
+            )
+            normalized = unicodedata.normalize("NFD", summary_search_prompt)
+            stripped = "".join(c for c in normalized if unicodedata.category(c) != "Mn")
+            encoded_prompt = quote(stripped, safe="", encoding=_ENCODING)
 
         offset = (desired_page - 1) * _RESULTS_PER_PAGE + 1
-        params = {
-            "b": "ACOR",
-            "O": "RR",
-            "ementa": summary_search_prompt,
-            "acao": "pesquisar",
-            "novaConsulta": "true" if desired_page == 1 else "false",
-            "i": str(offset),
-            "tipoPesquisa": "tipoPesquisaGenerica",
-            "thesaurus": "JURIDICO",
-            "p": "true",
-            "tp": "T",
-        }
-        # Encode each value as ISO-8859-1 percent-encoded
-        parts = []
-        for key, value in params.items():
-            try:
-                encoded_value = quote(value, safe="", encoding=_ENCODING)
-            except UnicodeEncodeError:
-                # Fallback: strip diacritics for chars outside ISO-8859-1
-                _LOGGER.warning(
-                    "ISO-8859-1 encoding failed for key=%s, stripping diacritics",
-                    key,
-                )
-                normalized = unicodedata.normalize("NFD", value)
-                stripped = "".join(
-                    c for c in normalized if unicodedata.category(c) != "Mn"
-                )
-                encoded_value = quote(stripped, safe="", encoding=_ENCODING)
-            parts.append(f"{key}={encoded_value}")
+        new_search = "true" if desired_page == 1 else "false"
+        parts = (
+            f"ementa={encoded_prompt}",
+            f"novaConsulta={new_search}",
+            f"i={offset}",
+            _STATIC_FORM_BODY,
+        )
 
         body = "&".join(parts).encode("ascii")
         _LOGGER.debug("Form body: %s", body[:200])
@@ -117,7 +174,8 @@ class StjLegalPrecedent(BaseLegalPrecedent):
     @classmethod
     def _parse_ementas(cls, html: str) -> list[Self]:
         """Extract ementa texts from the HTML response."""
-        matches = _EMENTA_PATTERN.findall(html)
+        # Pages without results are common and can be told apart without running the regex.
+        matches = _EMENTA_PATTERN.findall(html) if "textSemformatacao" in html else []
         _LOGGER.debug("Found %d ementa(s) in response", len(matches))
 
         if not matches:
@@ -126,24 +184,18 @@ class StjLegalPrecedent(BaseLegalPrecedent):
                 return []
 
             if "erroMensagem" in html:
-                error_match = re.search(
-                    r'<div class="erroMensagem">(.*?)</div>', html, re.DOTALL
-                )
+                error_match = _ERROR_MESSAGE_PATTERN.search(html)
                 error_text = error_match.group(1).strip() if error_match else "Unknown"
                 _LOGGER.warning("SCON returned an error: %s", error_text)
                 return []
 
-        return [
-            cls(summary=text.strip())
-            for text in matches
-            if text.strip()
-        ]
+        return [cls(summary=ementa) for text in matches if (ementa := text.strip())]
 
     @override
     @classmethod
     async def research(
         cls,
-        browser: "Page",  # pyright: ignore[reportUnusedParameter]
+        browser: "Page | None",  # pyright: ignore[reportUnusedParameter]
         *,
         summary_search_prompt: str,
         desired_page: int = 1,
@@ -154,31 +206,30 @@ class StjLegalPrecedent(BaseLegalPrecedent):
         but is NOT used. This implementation bypasses Cloudflare by
         posting directly to processo.stj.jus.br instead of scon.stj.jus.br.
         """
-        _LOGGER.info(
-            "Starting HTTP research for STJ legal precedents: %s (page %d) "
-            "[len=%d, is_NFC=%s, utf8_hex=%s]",
-            repr(summary_search_prompt),
-            desired_page,
-            len(summary_search_prompt),
-            unicodedata.is_normalized("NFC", summary_search_prompt),
-            summary_search_prompt.encode("utf-8").hex(),
-        )
+        # The encoding diagnostics are costly to compute, so only do it if they will be logged.
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(
+                "Starting HTTP research for STJ legal precedents: %r (page %d) "
+                "[len=%d, is_NFC=%s, utf8_hex=%s]",
+                summary_search_prompt,
+                desired_page,
+                len(summary_search_prompt),
+                unicodedata.is_normalized("NFC", summary_search_prompt),
+                summary_search_prompt.encode("utf-8").hex(),
+            )
 
         form_body = cls._build_form_body(summary_search_prompt, desired_page)
         last_error: Exception | None = None
 
+        client = _get_client()
+
         for attempt in range(1, _MAX_RETRIES + 1):
             try:
-                async with httpx.AsyncClient(
-                    timeout=_HTTP_TIMEOUT,
-                    verify=False,  # noqa: S501 — STJ cert chain sometimes incomplete
-                    follow_redirects=True,
-                ) as client:
-                    response = await client.post(
-                        _SEARCH_URL,
-                        headers=_HEADERS,
-                        content=form_body,
-                    )
+                response = await client.post(
+                    _SEARCH_URL,
+                    headers=_HEADERS,
+                    content=form_body,
+                )
 
                 _LOGGER.debug(
                     "SCON HTTP response: status=%d, length=%d",
@@ -206,6 +257,52 @@ class StjLegalPrecedent(BaseLegalPrecedent):
                     exc,
                 )
 
+                if isinstance(exc, httpx.TimeoutException):
+                    # The request timeout has already waited long enough before this retry.
+                    continue
+
+            if attempt < _MAX_RETRIES:
+                # Retrying right away rarely helps against a server that just failed.
+                await asyncio.sleep(_RETRY_DELAY)
+
         raise RuntimeError(
             f"STJ research failed after {_MAX_RETRIES} attempts"
         ) from last_error
+
+    @classmethod
+    async def research_pages(
+        cls,
+        *,
+        summary_search_prompt: str,
+        pages: "Iterable[int]",
+    ) -> list[Self]:
+        """Search several pages of STJ jurisprudence concurrently.
+
+        Every page is a self-contained HTTP POST, so they can be fetched side by
+        side. At most ``_MAX_CONCURRENT_PAGES`` requests are in flight at once,
+        to keep the load on SCON reasonable. If any page fails, the others are
+        cancelled and its error is raised.
+
+        :param summary_search_prompt: The summary to search for.
+        :param pages: The pages of results to scrape.
+        :return: The legal precedents of all pages, in page order."""
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_PAGES)
+
+        async def research_page(desired_page: int) -> list[Self]:
+            async with semaphore:
+                return await cls.research(
+                    None,
+                    summary_search_prompt=summary_search_prompt,
+                    desired_page=desired_page,
+                )
+
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                tasks = [task_group.create_task(research_page(page)) for page in pages]
+        except ExceptionGroup as exc_group:
+            # Callers expect the same errors as from `research`, not a group of them, and with
+            # their original cause preserved.
+            exc = exc_group.exceptions[0]
+            raise exc from exc.__cause__
+
+        return [precedent for task in tasks for precedent in task.result()]
@@ -1,8 +1,6 @@
-import contextlib
 import logging
 from typing import TYPE_CHECKING, Self, override
 
-from patchright.async_api import TimeoutError
 from pydantic import field_validator
 
 from brlaw_mcp_server.domain.base import BaseLegalPrecedent
@@ -42,30 +40,39 @@ class TstLegalPrecedent(BaseLegalPrecedent):
         cls, browser: "Page", *, summary_search_prompt: str, desired_page: int = 1
     ) -> "list[Self]":
         _LOGGER.info(
-            "Starting research for legal precedents authored by the TST with the summary search prompt %s",
-            repr(summary_search_prompt),
+            "Starting research for legal precedents authored by the TST with the summary search prompt %r",
+            summary_search_prompt,
         )
 
-        await browser.goto("https://jurisprudencia.tst.jus.br/")
+        # The notice dialog shows up at an unpredictable moment, so instead of probing for it
+        # with a fixed timeout, let the page dismiss it whenever it gets in the way.
+        locator_close_button = browser.locator("span[class^='jss']").filter(
+            has_text="Fechar"
+        )
+        await browser.add_locator_handler(
+            locator_close_button, lambda locator: locator.click()
+        )
 
-        with contextlib.suppress(TimeoutError):
-            await (
-                browser.locator("span[class^='jss']")
-                .filter(has_text="Fechar")
-                .click(timeout=1000)
+        try:
+            # No need to wait for every subresource: filling the input below auto-waits for it.
+            await browser.goto(
+                "https://jurisprudencia.tst.jus.br/", wait_until="domcontentloaded"
             )
 
-        locator_summary_input = browser.locator("#campoTxtEmenta")
-        await locator_summary_input.fill(summary_search_prompt)
-        await locator_summary_input.press("Enter")
+            locator_summary_input = browser.locator("#campoTxtEmenta")
+            await locator_summary_input.fill(summary_search_prompt)
+            await locator_summary_input.press("Enter")
 
-        await browser.locator("circle").wait_for(state="hidden", timeout=1000 * 30)
+            await browser.locator("circle").wait_for(state="hidden", timeout=1000 * 30)
 
-        precedents = [
-            cls(summary=text)
-            for locator in await browser.locator("div[id^=celulaLeiaMaisAcordao]").all()
-            if (text := await locator.text_content()) is not None
-        ]
+            precedents = [
+                cls(summary=text)
+                for text in await browser.locator(
+                    "div[id^=celulaLeiaMaisAcordao]"
+                ).all_text_contents()
+            ]
+        finally:
+            await browser.remove_locator_handler(locator_close_button)
 
         _LOGGER.info(
             "Found %d legal precedents",
@@ -10,9 +10,9 @@ from pydantic import BaseModel, Field
 
 from brlaw_mcp_server.domain.base import BaseLegalPrecedent
 from brlaw_mcp_server.domain.stf import StfLegalPrecedent
-from brlaw_mcp_server.domain.stj import StjLegalPrecedent
+from brlaw_mcp_server.domain.stj import StjLegalPrecedent, close_shared_client
 from brlaw_mcp_server.domain.tst import TstLegalPrecedent
-from brlaw_mcp_server.utils import browser_factory
+from brlaw_mcp_server.utils import browser_factory, close_shared_browsers
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -191,6 +191,20 @@ class StjLegalPrecedentsRequest(BaseLegalPrecedentsRequest):
         ],
     )
 
+    page_count: int = Field(
+        title="Quantidade de páginas",
+        description=textwrap.dedent("""
+            A quantidade de páginas consecutivas dos resultados a serem retornadas, a partir da 
+            página indicada.
+
+            As páginas são pesquisadas simultaneamente. Assim, quando já se sabe que serão 
+            necessárias várias páginas, é mais rápido requisitá-las de uma só vez do que uma a 
+            uma."""),
+        ge=1,
+        le=4,
+        default=1,
+    )
+
 
 class TstLegalPrecedentsRequest(BaseLegalPrecedentsRequest):
     """Requisição dos precedentes judiciais do Tribunal Superior do Trabalho (TST) que satisfaçam os critérios passados.
@@ -391,12 +405,11 @@ async def call_tool(
 
     # STJ uses direct HTTP (no browser needed); other courts use browser
     try:
-        if domain_model is StjLegalPrecedent:
+        if isinstance(request, StjLegalPrecedentsRequest):
             # STJ bypasses Cloudflare via processo.stj.jus.br HTTP POST
-            precedents = await method(
-                None,  # pyright: ignore[reportArgumentType] — browser not used
+            precedents = await StjLegalPrecedent.research_pages(
                 summary_search_prompt=request.summary,
-                desired_page=request.page,
+                pages=range(request.page, request.page + request.page_count),
             )
         else:
             async with (
@@ -436,8 +449,12 @@ async def _serve() -> None:
 
     options = server.create_initialization_options()
 
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(read_stream, write_stream, options, raise_exceptions=True)
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(read_stream, write_stream, options, raise_exceptions=True)
+    finally:
+        await close_shared_browsers()
+        await close_shared_client()
 
 
 def serve() -> None:
@@ -1,31 +1,172 @@
+import asyncio
 import logging
 from contextlib import asynccontextmanager
-from typing import TYPE_CHECKING
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Final
 
 from patchright.async_api import async_playwright
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator
 
-    from patchright.async_api import BrowserContext
+    from patchright.async_api import Browser, BrowserContext, Playwright
 
 _LOGGER = logging.getLogger(__name__)
 
+_BROWSER_IDLE_TIMEOUT_SECONDS: Final = 60.0
+"""How long a shared browser is kept alive after its last user is gone."""
 
-@asynccontextmanager
-async def browser_factory(
-    headless: bool = True,
-) -> "AsyncGenerator[BrowserContext, None]":
-    """Standard browser factory using patchright (Chromium). Used for STF and TST."""
-    async with async_playwright() as playwright:
+
+@dataclass
+class _SharedBrowser:
+    """A Chromium process shared by every concurrent user of ``browser_factory``."""
+
+    playwright: "Playwright"
+    browser: "Browser"
+    users: int = 0
+    idle_closer: "asyncio.Task[None] | None" = None
+
+
+@dataclass
+class _LoopSharedBrowsers:
+    """The shared browsers of an event loop, keyed by whether they are headless."""
+
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    browsers: dict[bool, _SharedBrowser] = field(default_factory=dict)
+
+
+_shared_browsers_by_loop: Final[
+    dict[asyncio.AbstractEventLoop, _LoopSharedBrowsers]
+] = {}
+"""Playwright objects can only be used from the event loop that created them, hence every loop
+gets its own shared browsers."""
+
+
+def _get_loop_shared_browsers() -> _LoopSharedBrowsers:
+    """Get the shared browsers of the running event loop."""
+    # Browsers of closed loops can't be used, nor even closed, anymore. Just forget them.
+    for loop in [loop for loop in _shared_browsers_by_loop if loop.is_closed()]:
+        _LOGGER.warning("Dropping the shared browsers of a closed event loop")
+        del _shared_browsers_by_loop[loop]
+
+    return _shared_browsers_by_loop.setdefault(
+        asyncio.get_running_loop(), _LoopSharedBrowsers()
+    )
+
+
+async def _launch_browser(headless: bool) -> _SharedBrowser:
+    playwright = await async_playwright().start()
+    try:
         browser = await playwright.chromium.launch(
             headless=headless,
             args=[
                 "--disable-blink-features=AutomationControlled",
                 "--no-sandbox",
+                # Skip startup work that is useless for scraping.
+                "--disable-background-networking",
+                "--disable-default-apps",
+                "--disable-dev-shm-usage",
+                "--disable-sync",
+                "--no-first-run",
             ],
         )
-        context = await browser.new_context(
+    except BaseException:
+        await playwright.stop()
+        raise
+
+    _LOGGER.info("Launched a shared browser", extra={"headless": headless})
+    return _SharedBrowser(playwright=playwright, browser=browser)
+
+
+async def _close_browser(shared: _SharedBrowser) -> None:
+    try:
+        await shared.browser.close()
+    finally:
+        await shared.playwright.stop()
+
+
+async def _acquire_browser(headless: bool) -> _SharedBrowser:
+    """Get the shared browser, launching it if there is none yet."""
+    loop_shared_browsers = _get_loop_shared_browsers()
+    async with loop_shared_browsers.lock:
+        shared = loop_shared_browsers.browsers.get(headless)
+
+        if shared is not None and shared.idle_closer is not None:
+            shared.idle_closer.cancel()
+            shared.idle_closer = None
+
+        if (
+            shared is not None
+            and not shared.browser.is_connected()
+            and not shared.users
+        ):
+            _LOGGER.warning("Shared browser disconnected, relaunching it")
+            del loop_shared_browsers.browsers[headless]
+            await _close_browser(shared)
+            shared = None
+
+        if shared is None:
+            shared = loop_shared_browsers.browsers[headless] = await _launch_browser(
+                headless
+            )
+
+        shared.users += 1
+        return shared
+
+
+async def _release_browser(headless: bool, shared: _SharedBrowser) -> None:
+    """Give the shared browser back, scheduling its closing if it became idle."""
+    loop_shared_browsers = _get_loop_shared_browsers()
+    async with loop_shared_browsers.lock:
+        shared.users -= 1
+
+        # It may have been closed meanwhile by ``close_shared_browsers``.
+        if not shared.users and loop_shared_browsers.browsers.get(headless) is shared:
+            shared.idle_closer = asyncio.create_task(_close_browser_when_idle(headless))
+
+
+async def _close_browser_when_idle(headless: bool) -> None:
+    await asyncio.sleep(_BROWSER_IDLE_TIMEOUT_SECONDS)
+
+    loop_shared_browsers = _get_loop_shared_browsers()
+    async with loop_shared_browsers.lock:
+        shared = loop_shared_browsers.browsers.get(headless)
+        if shared is None or shared.users:
+            return
+
+        del loop_shared_browsers.browsers[headless]
+
+    _LOGGER.info("Closing idle shared browser", extra={"headless": headless})
+    await _close_browser(shared)
+
+
+async def close_shared_browsers() -> None:
+    """Close every shared browser of the running event loop. Meant to be called on shutdown."""
+    loop_shared_browsers = _get_loop_shared_browsers()
+    async with loop_shared_browsers.lock:
+        shared_browsers = list(loop_shared_browsers.browsers.values())
+        loop_shared_browsers.browsers.clear()
+
+    for shared in shared_browsers:
+        if shared.idle_closer is not None:
+            shared.idle_closer.cancel()
+
+        await _close_browser(shared)
+
+
+@asynccontextmanager
+async def browser_factory(
+    headless: bool = True,
+) -> "AsyncGenerator[BrowserContext, None]":
+    """Standard browser factory using patchright (Chromium). Used for STF and TST.
+
+    Launching Chromium is by far the most expensive step, so the process is shared among callers
+    and kept alive for a while after the last one leaves. Each caller still gets a fresh context,
+    thus no cookies or storage leak between them. Process-wide state, such as the clipboard, is
+    shared though, so callers relying on it must serialize their access to it."""
+    shared = await _acquire_browser(headless)
+    try:
+        context = await shared.browser.new_context(
             user_agent="Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/137.0.0.0 Safari/537.36",
             viewport={"width": 1920, "height": 1080},
             locale="pt-BR",
@@ -34,4 +175,5 @@ async def browser_factory(
             yield context
         finally:
             await context.close()
-            await browser.close()
+    finally:
+        await _release_browser(headless, shared)
@@ -1,9 +1,24 @@
 import logging
+from typing import TYPE_CHECKING
 
 import pytest
 
+from brlaw_mcp_server.domain.stj import close_shared_client
+from brlaw_mcp_server.utils import close_shared_browsers
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
 
 @pytest.fixture(autouse=True)
 def setup_logging(caplog: pytest.LogCaptureFixture) -> None:
     """Allow all log records to be captured."""
     caplog.set_level(logging.DEBUG)
+
+
+@pytest.fixture(autouse=True, scope="session")
+async def close_shared_resources() -> "AsyncGenerator[None, None]":
+    """Close the browsers and HTTP client shared among the tests once the session is over."""
+    yield
+    await close_shared_browsers()
+    await close_shared_client()
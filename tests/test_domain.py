@@ -1,7 +1,9 @@
 import asyncio
 
+import httpx
 import pytest
 
+from brlaw_mcp_server.domain import stj
 from brlaw_mcp_server.domain.base import BaseLegalPrecedent
 from brlaw_mcp_server.domain.stf import StfLegalPrecedent
 from brlaw_mcp_server.domain.stj import StjLegalPrecedent
@@ -55,3 +57,60 @@ async def test_research_legal_precedents(
                 return
 
             assert all(isinstance(precedent, class_) for precedent in precedents)
+
+
+async def test_research_stj_legal_precedents_pages() -> None:
+    """Test researching several pages of STJ legal precedents at once."""
+
+    async with asyncio.timeout(30):
+        precedents = await StjLegalPrecedent.research_pages(
+            summary_search_prompt="fraude execução",
+            pages=range(1, 3),
+        )
+
+    assert all(isinstance(precedent, StjLegalPrecedent) for precedent in precedents)
+    # Results from the second page must not merely repeat the first one.
+    assert len({precedent.summary for precedent in precedents}) > 10
+
+
+async def test_research_stf_legal_precedents_concurrently() -> None:
+    """Test that concurrent STF researches sharing a browser don't mix up their summaries.
+
+    STF summaries are read through the clipboard, which belongs to the whole browser."""
+
+    async def research(summary: str) -> set[str]:
+        async with browser_factory() as browser:
+            page = await browser.new_page()
+            precedents = await StfLegalPrecedent.research(
+                page, summary_search_prompt=summary
+            )
+
+        assert precedents
+        return {precedent.summary for precedent in precedents}
+
+    async with asyncio.timeout(60):
+        # Subjects unrelated enough not to share any precedent.
+        extradition_summaries, tax_summaries = await asyncio.gather(
+            research("extradição"), research("ICMS substituição tributária")
+        )
+
+    assert extradition_summaries.isdisjoint(tax_summaries)
+
+
+async def test_research_stj_legal_precedents_pages_keeps_error_cause(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that a failing page raises the same error, with the same cause, as `research`."""
+    monkeypatch.setattr(stj, "_RETRY_DELAY", 0)
+
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda _: httpx.Response(503))
+    ) as client:
+        monkeypatch.setattr(stj, "_get_client", lambda: client)
+
+        with pytest.raises(RuntimeError, match="STJ research failed") as exc_info:
+            await StjLegalPrecedent.research_pages(
+                summary_search_prompt="fraude execução", pages=range(1, 3)
+            )
+
+    assert isinstance(exc_info.value.__cause__, httpx.HTTPStatusError)
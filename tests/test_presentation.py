@@ -41,6 +41,11 @@ async def test_listed_tools() -> None:
             {"summary": "fraude execução"},
             id="valid_tool_call",
         ),
+        pytest.param(
+            StjLegalPrecedentsRequest.__name__,
+            {"summary": "fraude execução", "page_count": 2},
+            id="valid_tool_call_many_pages",
+        ),
     ],
 )
 async def test_call_tool(
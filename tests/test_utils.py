@@ -0,0 +1,65 @@
+"""Tests for the utilities."""
+
+import asyncio
+
+import pytest
+
+from brlaw_mcp_server import utils
+from brlaw_mcp_server.utils import browser_factory, close_shared_browsers
+
+
+async def _get_browser_of_factory() -> object:
+    async with browser_factory() as context:
+        return context.browser
+
+
+async def test_browser_factory_shares_browser(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that users of the factory share a browser, which is closed once idle."""
+    monkeypatch.setattr(utils, "_BROWSER_IDLE_TIMEOUT_SECONDS", 0.5)
+    await close_shared_browsers()  # Start from scratch, regardless of previous tests.
+
+    async with asyncio.timeout(30):
+        browsers = await asyncio.gather(*(_get_browser_of_factory() for _ in range(3)))
+        browser = browsers[0]
+        assert all(other_browser is browser for other_browser in browsers)
+
+        # Still within the idle timeout, thus it must be reused.
+        assert await _get_browser_of_factory() is browser
+
+        await asyncio.sleep(1)
+        assert not utils._get_loop_shared_browsers().browsers  # pyright: ignore[reportPrivateUsage]
+
+        assert await _get_browser_of_factory() is not browser
+
+    await close_shared_browsers()
+
+
+def test_browser_factory_across_event_loops() -> None:
+    """Test that a browser launched in an event loop is not reused by another one.
+
+    Playwright objects are bound to the event loop that created them, thus reusing them from
+    another loop would hang forever."""
+
+    async def get_browser(close: bool) -> object:
+        async with asyncio.timeout(30):
+            browser = await _get_browser_of_factory()
+            if close:
+                await close_shared_browsers()
+
+        return browser
+
+    # Not using `asyncio.run`, as it would unset the event loop of the other tests.
+    browsers: list[object] = []
+    for close in (False, True):
+        loop = asyncio.new_event_loop()
+        try:
+            browsers.append(loop.run_until_complete(get_browser(close=close)))
+        finally:
+            # Like `asyncio.run`, cancel what is left, such as the idle browser closer.
+            if tasks := asyncio.all_tasks(loop):
+                for task in tasks:
+                    task.cancel()
+                loop.run_until_complete(asyncio.wait(tasks))
+            loop.close()
+
+    assert browsers[0] is not browsers[1]